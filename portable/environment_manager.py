@@ -9,17 +9,34 @@ import logging
 from pathlib import Path
 from typing import Dict, Optional
 
+from portable._settings import load_settings
+
 class EnvironmentManager:
     def __init__(self, settings_path: str = "settings.json"):
         self.settings_path = settings_path
-        self.settings = self.load_settings()
         self.logger = logging.getLogger(__name__)
+        self.settings = self.load_settings()
+        # Settings and the interpreter layout are fixed for the life of
+        # the process, so resolve these once here instead of re-walking
+        # the settings dict and the filesystem on every call
+        self._refresh_env_cache()
+
+    def _refresh_env_cache(self) -> None:
+        """Recompute the cached environment facts."""
+        self._is_venv = hasattr(sys, 'real_prefix') or (
+            hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix
+        )
+        self._python_path = self._compute_python_path()
+        self._site_packages = self._compute_site_packages_path()
+
+    def invalidate_env_cache(self) -> None:
+        """Refresh cached paths after the environment changes on disk."""
+        self._refresh_env_cache()
 
     def load_settings(self) -> Dict:
         """Load settings from JSON file."""
         try:
-            with open(self.settings_path, 'r') as f:
-                return json.load(f)
+            return load_settings(self.settings_path)
         except FileNotFoundError:
             self.logger.warning(f"Settings file not found: {self.settings_path}")
             return {}
@@ -37,14 +54,16 @@ class EnvironmentManager:
 
             self.logger.info(f"Creating virtual environment at {venv_path}")
             venv.create(venv_path, with_pip=True)
+            # The venv's python now exists, so the cached path is stale
+            self.invalidate_env_cache()
             return True
 
         except Exception as e:
             self.logger.error(f"Failed to create virtual environment: {e}")
             return False
 
-    def get_python_path(self) -> str:
-        """Get the appropriate Python executable path."""
+    def _compute_python_path(self) -> str:
+        """Resolve the Python executable path from the settings."""
         if self.settings.get("environment", {}).get("use_venv", False):
             venv_path = Path(self.settings["environment"]["venv_path"])
             if sys.platform == "win32":
@@ -54,23 +73,29 @@ class EnvironmentManager:
             return str(python_path) if python_path.exists() else sys.executable
         return self.settings.get("environment", {}).get("python_path", sys.executable)
 
+    def get_python_path(self) -> str:
+        """Get the appropriate Python executable path."""
+        return self._python_path
+
     def is_venv_active(self) -> bool:
         """Check if running in a virtual environment."""
-        return hasattr(sys, 'real_prefix') or (
-            hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix
-        )
+        return self._is_venv
 
-    def get_site_packages_path(self) -> Optional[str]:
-        """Get the site-packages directory path."""
+    def _compute_site_packages_path(self) -> Optional[str]:
+        """Resolve the site-packages directory path."""
         try:
             import site
-            if self.is_venv_active():
+            if self._is_venv:
                 return site.getsitepackages()[0]
             return site.getusersitepackages()
         except Exception as e:
             self.logger.error(f"Failed to get site-packages path: {e}")
             return None
 
+    def get_site_packages_path(self) -> Optional[str]:
+        """Get the site-packages directory path."""
+        return self._site_packages
+
     def set_environment_variable(self, key: str, value: str):
         """Set an environment variable."""
         os.environ[key] = value
@@ -91,20 +116,26 @@ class EnvironmentManager:
                 self.logger.error(f"Virtual environment not found at {venv_path}")
                 return False
 
-            # Activate virtual environment
+            # Activate in-process by mutating the environment directly.
+            # This is what activate_this.py did, minus the file read and
+            # exec in a fresh namespace — and stdlib venvs (PEP 405)
+            # don't ship activate_this.py at all.
             if sys.platform == "win32":
-                activate_script = venv_path / "Scripts" / "activate_this.py"
+                bin_dir = venv_path / "Scripts"
             else:
-                activate_script = venv_path / "bin" / "activate_this.py"
-
-            if not activate_script.exists():
-                self.logger.error(f"Activation script not found: {activate_script}")
-                return False
-
-            with open(activate_script) as f:
-                exec(f.read(), {'__file__': str(activate_script)})
+                bin_dir = venv_path / "bin"
+
+            os.environ["VIRTUAL_ENV"] = str(venv_path)
+            os.environ["PATH"] = (
+                str(bin_dir) + os.pathsep + os.environ.get("PATH", "")
+            )
+            sys.prefix = str(venv_path)
+            sys.exec_prefix = str(venv_path)
+            import site
+            site.main()
 
             self.logger.info(f"Virtual environment activated: {venv_path}")
+            self.invalidate_env_cache()
             return True
 
         except Exception as e:
@@ -3,17 +3,56 @@ Installer and Updater module for managing application installation and updates
 """
 import os
 import sys
+import time
 import logging
+import datetime
+import fnmatch
 import subprocess
 import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from portable._settings import load_settings
+
 logger = logging.getLogger(__name__)
 
+# Names excluded from installation backups
+_BACKUP_IGNORE = ('backup*', 'temp*', '*.pyc', '__pycache__', 'venv')
+
+def _ignored(name: str) -> bool:
+    return any(fnmatch.fnmatch(name, pattern) for pattern in _BACKUP_IGNORE)
+
+def _hardlink_tree(src, dst: Path) -> None:
+    """Snapshot src into dst using hardlinks.
+
+    On the same filesystem this is a metadata-only operation — no file
+    data is read or rewritten, so backing up even large trees takes
+    milliseconds. Entries that can't be linked (e.g. across devices)
+    fall back to a real copy. Note the result is a snapshot sharing
+    inodes with the original, not an independent copy — the same
+    tradeoff rsync --link-dest makes.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            if _ignored(entry.name):
+                continue
+            target = dst / entry.name
+            if entry.is_dir(follow_symlinks=False):
+                _hardlink_tree(entry.path, target)
+            else:
+                try:
+                    os.link(entry.path, target, follow_symlinks=False)
+                except OSError:
+                    shutil.copy2(entry.path, target, follow_symlinks=False)
+
 class InstallerUpdater:
     def __init__(self, settings_path: str = "settings.json"):
         self.settings_path = settings_path
+        try:
+            self.settings = load_settings(settings_path)
+        except FileNotFoundError:
+            self.settings = {}
         self.root_dir = Path(os.path.dirname(os.path.abspath(__file__))).parent
         self.app_data = self.root_dir / "app_data"
         self.temp_dir = self.root_dir / "temp"
@@ -29,12 +68,10 @@ class InstallerUpdater:
         try:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = self.backup_dir / f"backup_{timestamp}"
-            
-            # Create backup of app files
-            shutil.copytree(self.root_dir, backup_path, ignore=shutil.ignore_patterns(
-                'backup*', 'temp*', '*.pyc', '__pycache__', 'venv'
-            ))
-            
+
+            # Snapshot app files via hardlinks instead of copying the data
+            _hardlink_tree(self.root_dir, backup_path)
+
             logger.info(f"Created backup at {backup_path}")
             return True
         except Exception as e:
@@ -79,9 +116,21 @@ class InstallerUpdater:
     def _install_linux_dependencies(self) -> bool:
         """Install Linux-specific dependencies."""
         try:
-            # Update package list
-            subprocess.run(["sudo", "apt-get", "update"], check=True)
-            
+            # Update package list, but skip the (seconds-long, purely
+            # network-bound) refresh when the lists are less than 10
+            # minutes old
+            try:
+                lists_age = time.time() - os.stat("/var/lib/apt/lists").st_mtime
+            except OSError:
+                lists_age = None
+            if lists_age is None or lists_age > 600:
+                subprocess.run(
+                    ["sudo", "apt-get", "update"],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+
             # Install required packages
             packages = [
                 "python3-dev",
@@ -91,8 +140,13 @@ class InstallerUpdater:
                 "libssl-dev",
                 "libffi-dev",
             ]
-            
-            subprocess.run(["sudo", "apt-get", "install", "-y"] + packages, check=True)
+
+            subprocess.run(
+                ["sudo", "apt-get", "install", "-y"] + packages,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
             return True
         except Exception as e:
             logger.error(f"Failed to install Linux dependencies: {e}")
@@ -116,12 +170,19 @@ class InstallerUpdater:
 
     def _check_visual_cpp_build_tools(self) -> bool:
         """Check if Visual C++ Build Tools are installed."""
-        # Check common installation paths
-        paths_to_check = [
-            r"C:\Program Files (x86)\Microsoft Visual Studio",
-            r"C:\Program Files\Microsoft Visual Studio",
-        ]
-        return any(os.path.exists(path) for path in paths_to_check)
+        # One scandir per Program Files root instead of stat'ing each
+        # candidate install path
+        for parent in (r"C:\Program Files (x86)", r"C:\Program Files"):
+            try:
+                with os.scandir(parent) as entries:
+                    if any(
+                        entry.name.startswith("Microsoft Visual Studio")
+                        for entry in entries
+                    ):
+                        return True
+            except OSError:
+                continue
+        return False
 
     def check_for_updates(self) -> Tuple[bool, str]:
         """Check if updates are available."""
@@ -6,20 +6,37 @@ import sys
 import os
 from typing import List, Dict
 
+from portable._settings import load_settings
+
 class DependencyInstaller:
     def __init__(self, settings_path: str = "settings.json"):
         self.settings_path = settings_path
-        self.settings = self.load_settings()  # Assuming a method to load settings
+        self.settings = self.load_settings()
 
     def install_pip_package(self, package: str) -> bool:
         """
         Install a Python package using pip
-        
+
         Returns:
             bool: True if installation was successful
         """
+        return self.install_pip_packages([package])
+
+    def install_pip_packages(self, packages: List[str]) -> bool:
+        """
+        Install Python packages in a single pip invocation
+
+        Each pip subprocess pays several hundred ms of interpreter and
+        pip import startup, so batching N packages into one call
+        amortizes that cost once.
+
+        Returns:
+            bool: True if installation was successful
+        """
+        if not packages:
+            return True
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
             return True
         except subprocess.CalledProcessError:
             return False
@@ -46,17 +63,28 @@ class DependencyInstaller:
         if verbose:
             print("Installing missing dependencies...")
         
-        # Install Python packages
-        for package in missing['packages']:
+        # Install Python packages in one batched pip call; fall back to
+        # per-package installs only on failure so we can report which
+        # individual packages are the problem
+        packages = missing['packages']
+        if packages:
             if verbose:
-                print(f"\nInstalling {package}...")
-            if self.install_pip_package(package):
+                print(f"\nInstalling {', '.join(packages)}...")
+            if self.install_pip_packages(packages):
                 if verbose:
-                    print(f"✅ Successfully installed {package}")
+                    for package in packages:
+                        print(f"✅ Successfully installed {package}")
             else:
-                if verbose:
-                    print(f"❌ Failed to install {package}")
-                all_ok = False
+                for package in packages:
+                    if verbose:
+                        print(f"\nInstalling {package}...")
+                    if self.install_pip_package(package):
+                        if verbose:
+                            print(f"✅ Successfully installed {package}")
+                    else:
+                        if verbose:
+                            print(f"❌ Failed to install {package}")
+                        all_ok = False
         
         # Handle system dependencies
         if missing['commands']:
@@ -76,8 +104,10 @@ class DependencyInstaller:
 
     def load_settings(self):
         """Load settings from a JSON file."""
-        # Placeholder for loading settings logic
-        return {}
+        try:
+            return load_settings(self.settings_path)
+        except FileNotFoundError:
+            return {}
 
 if __name__ == "__main__":
     # If run directly, install all dependencies
@@ -4,44 +4,138 @@ Integration utilities for the dependency checker
 
 import os
 import sys
+import json
 import logging
+import operator
+import dataclasses
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 import subprocess
 
 from portable.dependency_checker import DependencyChecker
 from portable.environment_manager import EnvironmentManager
 from portable.requirements_manager import RequirementsManager
-from portable.base_types import InstallationStatus  # Import InstallationStatus
+from portable.package_metadata import get_metadata
+from portable.base_types import DependencyResult, InstallationStatus
+
+# Serialize the report cache with orjson when available; it is several
+# times faster than the stdlib json module.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Dict:
+        return orjson.loads(data)
+
+    def _dumps(obj: Dict) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data: bytes) -> Dict:
+        return json.loads(data)
+
+    def _dumps(obj: Dict) -> bytes:
+        return json.dumps(obj).encode()
+
+# Prebuilt field tuple and C-level getter for serializing results; one
+# attrgetter call fetches every field of a DependencyResult without
+# asdict's per-field recursion
+_RESULT_FIELDS = tuple(f.name for f in dataclasses.fields(DependencyResult))
+_RESULT_GETTER = operator.attrgetter(*_RESULT_FIELDS)
 
 
 class Integration:
+    REPORT_CACHE_FILE = Path("logs") / ".report_cache.json"
+
     def __init__(self, settings_path: str = "settings.json"):
         self.logger = logging.getLogger(__name__)
         self.settings_path = settings_path
         self.dependency_checker = DependencyChecker(settings_path)
         self.env_manager = EnvironmentManager(settings_path)
         self.req_manager = RequirementsManager()
+        # Shared process-wide metadata instance: every Integration (and
+        # any sub-manager that needs PyPI data) sees the same cache and
+        # session rather than re-fetching per component
+        self.metadata = get_metadata()
+        # Shared dependency-check snapshot so one scan serves setup,
+        # launch and reporting within the same operation; keyed by the
+        # requirements file's mtime so edits force a rescan
+        self._dep_snapshot: Optional[Tuple[Optional[int], Tuple[bool, List]]] = None
+
+    def _requirements_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.dependency_checker.requirements_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _check_dependencies(self) -> Tuple[bool, List]:
+        """Run a dependency check, reusing the cached snapshot if current."""
+        mtime = self._requirements_mtime()
+        if self._dep_snapshot is None or self._dep_snapshot[0] != mtime:
+            self._dep_snapshot = (
+                mtime,
+                self.dependency_checker.check_all_dependencies(),
+            )
+        return self._dep_snapshot[1]
+
+    def invalidate_dependency_snapshot(self) -> None:
+        """Force the next dependency check to rescan the environment."""
+        self._dep_snapshot = None
+        # Installations change the report without touching its cache key
+        # (requirements mtime, interpreter, platform), so drop the
+        # rendered report too or the next generate_report would replay
+        # the stale pre-install result
+        try:
+            os.remove(self.REPORT_CACHE_FILE)
+        except OSError:
+            pass
+
+    def _pip_install(self, packages: List[str]) -> None:
+        """Install packages with pip, in-process when possible.
+
+        Running pip's CLI entry point inside this interpreter skips the
+        ~500 ms startup of a fresh Python subprocess; a batched
+        subprocess is the fallback when pip's internals aren't
+        importable.
+        """
+        import importlib.util
+
+        if importlib.util.find_spec("pip._internal.cli.main") is not None:
+            from pip._internal.cli.main import main as pip_main
+
+            rc = pip_main(["install", *packages])
+            if rc != 0:
+                raise RuntimeError(f"pip install exited with code {rc}")
+        else:
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", *packages],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
 
     def install_missing_dependencies(self) -> bool:
         """Install any missing dependencies required by the project."""
         try:
             self.logger.info("Checking for missing dependencies...")
-            all_ok, results = self.dependency_checker.check_all_dependencies()
+            all_ok, results = self._check_dependencies()
             if all_ok:
                 self.logger.info("All dependencies are installed.")
                 return True
 
-            for result in results:
-                if result.status == InstallationStatus.FAILED:
-                    self.logger.info(f"Installing missing dependency: {result.name}")
-                    subprocess.run(
-                        [sys.executable, "-m", "pip", "install", result.name],
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                    )
-                    self.logger.info(f"Successfully installed: {result.name}")
+            # One batched pip invocation instead of one subprocess per
+            # missing package; pip's startup cost is paid once
+            to_install = [
+                result.name
+                for result in results
+                if result.status == InstallationStatus.FAILED
+            ]
+            if to_install:
+                self.logger.info(
+                    f"Installing missing dependencies: {', '.join(to_install)}"
+                )
+                self._pip_install(to_install)
+                self.logger.info(f"Successfully installed: {', '.join(to_install)}")
+                # The installed set changed; the cached snapshot is stale
+                self.invalidate_dependency_snapshot()
 
             return True
 
@@ -69,6 +163,7 @@ class Integration:
             if not self.dependency_checker.setup_project():
                 self.logger.error("Failed to install dependencies")
                 return False
+            self.invalidate_dependency_snapshot()
 
             # Install any missing dependencies
             if not self.install_missing_dependencies():
@@ -88,7 +183,7 @@ class Integration:
         """
         try:
             # Verify environment and dependencies first
-            ok, results = self.dependency_checker.check_all_dependencies()
+            ok, results = self._check_dependencies()
             if not ok:
                 self.logger.error("Dependency check failed before launch")
                 return False
@@ -100,22 +195,68 @@ class Integration:
             self.logger.error(f"Application launch failed: {e}")
             return False
 
+    def _report_cache_key(self) -> List:
+        """Key identifying the inputs the report depends on."""
+        import platform
+        return [self._requirements_mtime(), sys.version, platform.system()]
+
+    def _load_cached_report(self, key: List) -> Optional[Dict]:
+        try:
+            with open(self.REPORT_CACHE_FILE, "rb") as f:
+                cached = _loads(f.read())
+            if cached.get("key") == key:
+                return cached["report"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+
+    def _store_cached_report(self, key: List, report: Dict) -> None:
+        try:
+            self.REPORT_CACHE_FILE.parent.mkdir(exist_ok=True)
+            tmp_path = self.REPORT_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps({"key": key, "report": report}))
+            os.replace(tmp_path, self.REPORT_CACHE_FILE)
+        except (OSError, TypeError) as e:
+            self.logger.debug(f"Could not cache report: {e}")
+
     def generate_report(self) -> Dict:
         """
         Generate a comprehensive report about the environment and dependencies.
         """
         try:
+            # Nothing in the report can change while requirements.txt,
+            # the interpreter and the platform stay the same, so repeat
+            # invocations reuse the rendered report from disk without
+            # rescanning the environment
+            key = self._report_cache_key()
+            cached = self._load_cached_report(key)
+            if cached is not None:
+                return cached
+
             env_info = self.env_manager.get_environment_info()
-            ok, dep_results = self.dependency_checker.check_all_dependencies()
+            ok, dep_results = self._check_dependencies()
 
-            return {
+            report = {
                 "environment": env_info,
                 "dependencies": {
                     "status": "ok" if ok else "failed",
-                    "results": [vars(r) for r in dep_results],
+                    # Copies rather than exposing each result's live
+                    # __dict__, and keeps working if the dataclass ever
+                    # grows __slots__; the status enum is flattened to
+                    # its value so the report is JSON-serializable
+                    "results": [
+                        dict(
+                            zip(_RESULT_FIELDS, _RESULT_GETTER(r)),
+                            status=r.status.value,
+                        )
+                        for r in dep_results
+                    ],
                 },
                 "requirements": self.req_manager.get_all_requirements(),
             }
+            self._store_cached_report(key, report)
+            return report
 
         except Exception as e:
             self.logger.error(f"Failed to generate report: {e}")
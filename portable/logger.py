@@ -1,7 +1,9 @@
 """
 Logging configuration for the dependency checker
 """
+import atexit
 import logging
+import logging.handlers
 import os
 from datetime import datetime
 from pathlib import Path
@@ -20,12 +22,28 @@ class LogManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_path = log_dir / f"{timestamp}_{self.log_file}"
         
+        log_format = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+
+        # Buffer file output in memory so records land on disk in a few
+        # large writes instead of one syscall per log line; errors and
+        # a full buffer flush immediately, and atexit catches the rest.
+        # The target formats records itself on flush, so it needs its
+        # own formatter — basicConfig only reaches the wrapper.
+        target = logging.FileHandler(log_path)
+        target.setFormatter(logging.Formatter(log_format))
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=target,
+        )
+        atexit.register(file_handler.flush)
+
         # Configure logging
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(name)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler(log_path),
+                file_handler,
                 logging.StreamHandler()
             ]
         )
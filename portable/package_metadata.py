@@ -2,87 +2,265 @@
 Package metadata and compatibility checker
 """
 
+import os
 import sys
 import json
-import requests
+import atexit
 import platform
-import pkg_resources
 import logging
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
-from packaging import version
 from pathlib import Path
 
+# requests (and its urllib3/idna/charset chain) and packaging are only
+# needed once PyPI is actually queried; importing them lazily keeps them
+# off the launch-only startup path of run_app.py
+
 logger = logging.getLogger(__name__)
 
+# Both are constant for the life of the process; platform.system() can
+# shell out to uname on first call, so resolve them once at import
+_CURRENT_PY = f"{sys.version_info.major}.{sys.version_info.minor}"
+_CURRENT_OS = platform.system().lower()
+
+# Classifier version strings ("3.8", "3.9", ...) repeat across every
+# package checked, so memoize their parsed form
+@functools.lru_cache(maxsize=512)
+def _parse_version(ver: str):
+    from packaging import version
+
+    return version.parse(ver)
+
+# Parse PyPI payloads with orjson when available; popular packages ship
+# multi-megabyte release listings and orjson parses them several times
+# faster than the stdlib json module.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Dict:
+        return orjson.loads(data)
+
+    def _dumps(obj: Dict) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data: bytes) -> Dict:
+        return json.loads(data)
+
+    def _dumps(obj: Dict) -> bytes:
+        return json.dumps(obj).encode()
+
+# Shared PyPI session. One module-level session keeps connections (and
+# their TLS handshakes) alive across every PackageMetadata instance in
+# the process instead of re-handshaking per instance.
+_SESSION = None
+
+
+def get_session():
+    """Return the shared HTTP session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        # Retry transient failures (DNS blips, PyPI 5xx, rate limiting)
+        # with backoff instead of silently dropping the package from the
+        # report and re-fetching everything on the next run
+        _SESSION = requests.Session()
+        _SESSION.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET"]),
+                ),
+            ),
+        )
+    return _SESSION
+
 
 class PackageMetadata:
     PYPI_API_URL = "https://pypi.org/pypi/{package}/json"
     WAREHOUSE_URL = "https://pypi.org/simple"
+    CACHE_FILE = Path.home() / ".cache" / "depchecker" / "pypi.json"
 
     def __init__(self):
         self._cache = {}
-        self.session = requests.Session()
+        self._etags = {}
+        # Packages fetched or revalidated during this process; entries
+        # loaded from disk stay out of this set until a conditional GET
+        # confirms them
+        self._validated = set()
+        self._dirty = False
+        # Computed package sizes, shared across size-impact queries so
+        # overlapping dependency trees are summed once per process
+        self._size_cache = {}
+        self._load_disk_cache()
+        atexit.register(self._save_disk_cache)
+
+    def _load_disk_cache(self) -> None:
+        """Seed the in-memory cache from the on-disk store, if present."""
+        try:
+            with open(self.CACHE_FILE, "rb") as f:
+                stored = _loads(f.read())
+            for name, entry in stored.items():
+                self._cache[name] = entry["data"]
+                if entry.get("etag"):
+                    self._etags[name] = entry["etag"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _save_disk_cache(self) -> None:
+        """Write validated cache entries back to disk."""
+        if not self._dirty:
+            return
+        try:
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            stored = {
+                name: {"etag": self._etags.get(name), "data": data}
+                for name, data in self._cache.items()
+            }
+            tmp_path = self.CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(stored))
+            os.replace(tmp_path, self.CACHE_FILE)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write PyPI metadata cache: {e}")
+
+    @staticmethod
+    def _index_classifiers(classifiers: List[str]) -> Dict[str, List[str]]:
+        """Bucket classifiers by prefix in a single pass.
+
+        The compatibility and health checks each care about a different
+        classifier family; indexing once means one traversal of the
+        list instead of one startswith scan per consumer.
+        """
+        idx = {"python": [], "os": [], "topic": [], "impl": [], "devstatus": []}
+        for c in classifiers:
+            first, _, rest = c.partition(" :: ")
+            if first == "Programming Language" and rest.startswith("Python"):
+                if rest.startswith("Python :: Implementation"):
+                    idx["impl"].append(c)
+                else:
+                    idx["python"].append(c)
+            elif first == "Operating System":
+                idx["os"].append(c)
+            elif first == "Topic":
+                idx["topic"].append(c)
+            elif first == "Development Status":
+                idx["devstatus"].append(c)
+        return idx
+
+    def _classifier_index(self, info: Dict) -> Dict[str, List[str]]:
+        """Return the cached classifier index for a package payload."""
+        idx = info.get("_index")
+        if idx is None:
+            idx = self._index_classifiers(info["info"].get("classifiers", []))
+            info["_index"] = idx
+        return idx
+
+    def _py_constraints(self, info: Dict) -> List:
+        """Return the package's Python-version constraints as (op, version)
+        pairs, extracting them from the classifiers once per payload.
+
+        Like the classifier index, the result is cached on the payload
+        (and therefore persisted with it), so the startswith/split/replace
+        string work runs once per package instead of once per check.
+        """
+        cons = info.get("_py_constraints")
+        if cons is None:
+            cons = []
+            for c in self._classifier_index(info)["python"]:
+                if c.endswith("Only"):
+                    continue
+                ver = c.split("::")[-1].strip()
+                if ver.startswith(">="):
+                    cons.append(("ge", ver[2:]))
+                elif ver.startswith("<="):
+                    cons.append(("le", ver[2:]))
+                else:
+                    cons.append(("eq", ver.replace("Python ", "")))
+            info["_py_constraints"] = cons
+        return cons
 
     def get_package_info(self, package_name: str) -> Optional[Dict]:
         """Fetch package information from PyPI."""
-        if package_name in self._cache:
-            return self._cache[package_name]
+        if package_name in self._validated:
+            return self._cache.get(package_name)
+
+        import requests
+
+        # Revalidate disk-cached entries with a conditional GET: on 304
+        # PyPI sends no payload and we reuse the stored body, so repeat
+        # report runs cost one header exchange per unchanged package
+        headers = {}
+        etag = self._etags.get(package_name)
+        if etag and package_name in self._cache:
+            headers["If-None-Match"] = etag
 
         try:
-            response = self.session.get(
-                self.PYPI_API_URL.format(package=package_name), timeout=10
+            response = get_session().get(
+                self.PYPI_API_URL.format(package=package_name),
+                timeout=10,
+                headers=headers,
             )
+            if response.status_code == 304:
+                self._validated.add(package_name)
+                return self._cache[package_name]
             response.raise_for_status()
-            self._cache[package_name] = response.json()
+            self._cache[package_name] = _loads(response.content)
+            new_etag = response.headers.get("ETag")
+            if new_etag:
+                self._etags[package_name] = new_etag
+            self._validated.add(package_name)
+            self._dirty = True
             return self._cache[package_name]
         except requests.RequestException as e:
             logger.warning(f"Failed to fetch metadata for {package_name}: {e}")
-            return None
+            # Fall back to a stale disk entry rather than nothing
+            return self._cache.get(package_name)
 
     def check_python_compatibility(
         self, package_name: str, python_version: str = None
     ) -> Tuple[bool, str]:
         """Check if package is compatible with current Python version."""
         if not python_version:
-            python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+            python_version = _CURRENT_PY
 
         info = self.get_package_info(package_name)
         if not info:
             return False, "Could not fetch package information"
 
+        from packaging import version
+
         try:
             latest_version = info["info"]["version"]
-            classifiers = info["info"]["classifiers"]
-
-            # Check Python version classifiers
-            python_versions = [
-                c.split("::")[-1].strip()
-                for c in classifiers
-                if c.startswith("Programming Language :: Python")
-                and not c.endswith("Only")
-                and not c.endswith("Implementation")
-            ]
 
-            if not python_versions:
+            constraints = self._py_constraints(info)
+            if not constraints:
                 return True, "No Python version restrictions found"
 
-            current = version.parse(python_version)
+            current = _parse_version(python_version)
             compatible = False
 
-            for ver in python_versions:
+            # Tight loop over the precomputed (op, version) pairs; the
+            # memoized parse makes the bound lookups effectively free
+            for op, val in constraints:
                 try:
-                    if ver.startswith(">="):
-                        min_ver = version.parse(ver[2:])
-                        if current >= min_ver:
-                            compatible = True
-                    elif ver.startswith("<="):
-                        max_ver = version.parse(ver[2:])
-                        if current <= max_ver:
+                    if op == "ge":
+                        if current >= _parse_version(val):
                             compatible = True
-                    else:
-                        ver = ver.replace("Python ", "")
-                        if ver == python_version:
+                    elif op == "le":
+                        if current <= _parse_version(val):
                             compatible = True
+                    elif val == python_version:
+                        compatible = True
                 except version.InvalidVersion:
                     continue
 
@@ -121,13 +299,11 @@ class PackageMetadata:
         if not info:
             return False, "Could not fetch package information"
 
-        current_platform = platform.system().lower()
+        current_platform = _CURRENT_OS
         try:
-            classifiers = info["info"]["classifiers"]
             platform_classifiers = [
                 c.split("::")[-1].strip().lower()
-                for c in classifiers
-                if c.startswith("Operating System")
+                for c in self._classifier_index(info)["os"]
             ]
 
             if not platform_classifiers:
@@ -153,9 +329,9 @@ class PackageMetadata:
             return []
 
         try:
-            classifiers = info["info"]["classifiers"]
             topics = [
-                c.split("::")[-1].strip() for c in classifiers if c.startswith("Topic")
+                c.split("::")[-1].strip()
+                for c in self._classifier_index(info)["topic"]
             ]
 
             alternatives = []
@@ -179,6 +355,19 @@ class PackageMetadata:
         try:
             latest_version = info["info"]["version"]
             release_info = info["releases"][latest_version]
+            idx = self._classifier_index(info)
+
+            # One pass over the release files for both the wheel flag
+            # and the size sum, instead of a scan per metric
+            has_wheel = False
+            package_size = 0
+            for r in release_info:
+                packagetype = r["packagetype"]
+                if packagetype == "bdist_wheel":
+                    has_wheel = True
+                    package_size += r["size"]
+                elif packagetype == "sdist":
+                    package_size += r["size"]
 
             return {
                 "name": package_name,
@@ -190,30 +379,18 @@ class PackageMetadata:
                 "release_date": (
                     release_info[0]["upload_time"] if release_info else None
                 ),
-                "has_wheel": any(
-                    r["packagetype"] == "bdist_wheel" for r in release_info
-                ),
+                "has_wheel": has_wheel,
                 "license": info["info"].get("license"),
-                "development_status": [
-                    c
-                    for c in info["info"]["classifiers"]
-                    if c.startswith("Development Status")
-                ],
+                "development_status": list(idx["devstatus"]),
                 "documentation_url": info["info"]
                 .get("project_urls", {})
                 .get("Documentation"),
                 "homepage": info["info"].get("home_page"),
                 "author": info["info"].get("author"),
                 "author_email": info["info"].get("author_email"),
-                "package_size": sum(
-                    r["size"]
-                    for r in release_info
-                    if r["packagetype"] in ("bdist_wheel", "sdist")
-                ),
+                "package_size": package_size,
                 "supported_implementations": [
-                    c.split("::")[-1].strip()
-                    for c in info["info"]["classifiers"]
-                    if c.startswith("Programming Language :: Python :: Implementation")
+                    c.split("::")[-1].strip() for c in idx["impl"]
                 ],
             }
         except Exception as e:
@@ -226,6 +403,8 @@ class PackageMetadata:
         if not info:
             return []
 
+        from packaging import version
+
         try:
             releases = []
             for version_str, release_info in info["releases"].items():
@@ -242,50 +421,55 @@ class PackageMetadata:
                             ),
                         }
                     )
-            return sorted(
-                releases, key=lambda x: version.parse(x["version"]), reverse=True
-            )
+            # Decorate-sort-undecorate: parse each version once instead
+            # of once per comparison during the sort
+            keyed = [(version.parse(r["version"]), r) for r in releases]
+            keyed.sort(key=lambda t: t[0], reverse=True)
+            return [r for _, r in keyed]
         except Exception as e:
             logger.error(f"Error getting release history for {package_name}: {e}")
             return []
 
     def get_package_size_impact(self, package_name: str) -> Dict[str, int]:
         """Calculate the total size impact of a package including its dependencies."""
-        total_size = 0
         dependency_sizes = {}
-
-        def calculate_size(pkg_name: str, visited: set):
-            if pkg_name in visited:
-                return 0
-            visited.add(pkg_name)
-
-            info = self.get_package_info(pkg_name)
-            if not info:
-                return 0
-
-            try:
-                latest_version = info["info"]["version"]
-                release_info = info["releases"][latest_version]
-
-                # Calculate package size
-                pkg_size = sum(
-                    r["size"]
-                    for r in release_info
-                    if r["packagetype"] in ("bdist_wheel", "sdist")
-                )
-
-                # Add dependency sizes
-                dependencies = self.get_package_dependencies(pkg_name)
-                dep_size = sum(calculate_size(dep, visited) for dep in dependencies)
-
-                dependency_sizes[pkg_name] = pkg_size
-                return pkg_size + dep_size
-
-            except Exception as e:
-                logger.error(f"Error calculating size for {pkg_name}: {e}")
-                return 0
-
-        total_size = calculate_size(package_name, set())
+        size_cache = self._size_cache
+        visited = {package_name}
+        queue = deque([package_name])
+
+        # Walk the dependency graph breadth-first from an explicit
+        # worklist, draining a layer at a time so each layer's metadata
+        # fetches run in parallel. The work is network-bound, so threads
+        # give near-linear speedup; 16 workers stays well under PyPI
+        # rate limits. Sizes are memoized so each package's release
+        # list is summed at most once, even in diamond-shaped graphs.
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            while queue:
+                layer = list(queue)
+                queue.clear()
+                infos = list(executor.map(self.get_package_info, layer))
+                for name, info in zip(layer, infos):
+                    if not info:
+                        continue
+                    try:
+                        if name not in size_cache:
+                            latest_version = info["info"]["version"]
+                            release_info = info["releases"][latest_version]
+                            size_cache[name] = sum(
+                                r["size"]
+                                for r in release_info
+                                if r["packagetype"] in ("bdist_wheel", "sdist")
+                            )
+                        dependency_sizes[name] = size_cache[name]
+
+                        for dep in self.get_package_dependencies(name):
+                            if dep not in visited:
+                                visited.add(dep)
+                                queue.append(dep)
+                    except Exception as e:
+                        logger.error(f"Error calculating size for {name}: {e}")
+
+        total_size = sum(dependency_sizes.values())
 
         return {
             "total_size": total_size,
@@ -293,3 +477,16 @@ class PackageMetadata:
             "dependencies_size": total_size - dependency_sizes.get(package_name, 0),
             "breakdown": dependency_sizes,
         }
+
+
+# Process-wide instance so every consumer shares one metadata cache and
+# one HTTP session instead of re-fetching the same PyPI payloads
+_INSTANCE: Optional[PackageMetadata] = None
+
+
+def get_metadata() -> PackageMetadata:
+    """Return the shared PackageMetadata instance, creating it on first use."""
+    global _INSTANCE
+    if _INSTANCE is None:
+        _INSTANCE = PackageMetadata()
+    return _INSTANCE
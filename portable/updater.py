@@ -3,14 +3,44 @@ Updater for the portable dependency checker
 """
 import subprocess
 import sys
+from importlib import metadata
+
+from portable.package_metadata import get_metadata
 
 class Updater:
     def __init__(self, package_name: str):
         self.package_name = package_name
 
+    def _latest_version(self) -> str:
+        """Get the latest released version from PyPI, or None."""
+        info = get_metadata().get_package_info(self.package_name)
+        if info:
+            return info["info"].get("version")
+        return None
+
     def check_for_updates(self) -> bool:
-        """Check for updates to the package."""
+        """Check for updates to the package and install only if outdated."""
         try:
+            # Compare the installed version against PyPI first: the
+            # common up-to-date case then costs one keep-alive GET
+            # instead of a pip subprocess doing real network and disk
+            # work on every invocation
+            try:
+                current = metadata.version(self.package_name)
+            except metadata.PackageNotFoundError:
+                current = None
+            latest = self._latest_version()
+
+            if current and latest:
+                try:
+                    from packaging import version
+                    up_to_date = version.parse(current) >= version.parse(latest)
+                except ImportError:
+                    up_to_date = current == latest
+                if up_to_date:
+                    print(f"{self.package_name} is already up to date ({current}).")
+                    return True
+
             result = subprocess.run(
                 [sys.executable, "-m", "pip", "install", "--upgrade", self.package_name],
                 capture_output=True,
@@ -58,17 +58,24 @@ def main():
         # Generate report if requested
         if args.report:
             report = integration.generate_report()
-            print("\nEnvironment and Dependency Report:")
-            print("-" * 40)
-            print(f"Python: {report['environment']['python_version']}")
-            print(f"Platform: {report['environment']['platform']}")
-            print(f"Virtual Environment: {'Active' if report['environment']['is_venv'] else 'Inactive'}")
-            if report['environment']['is_venv']:
-                print(f"Virtual Environment Path: {report['environment']['venv_path']}")
-            print("\nDependencies Status:", report['dependencies']['status'])
-            for dep in report['dependencies']['results']:
-                print(f"- {dep['name']}: {'✓' if dep['status'] == 'success' else '✗'} "
-                      f"(required: {dep['required_version']}, found: {dep['version']})")
+            env = report['environment']
+            deps = report['dependencies']
+            # Accumulate the report and emit it with a single write
+            # instead of one syscall per print
+            out = [
+                "\nEnvironment and Dependency Report:\n",
+                "-" * 40 + "\n",
+                f"Python: {env['python_version']}\n",
+                f"Platform: {env['platform']}\n",
+                f"Virtual Environment: {'Active' if env['is_venv'] else 'Inactive'}\n",
+            ]
+            if env['is_venv']:
+                out.append(f"Virtual Environment Path: {env['venv_path']}\n")
+            out.append(f"\nDependencies Status: {deps['status']}\n")
+            for dep in deps['results']:
+                out.append(f"- {dep['name']}: {'✓' if dep['status'] == 'success' else '✗'} "
+                           f"(required: {dep['required_version']}, found: {dep['version']})\n")
+            sys.stdout.write("".join(out))
             return 0
 
         # Setup project
@@ -0,0 +1,23 @@
+"""
+Optional build script for the portable dependency checker.
+
+When Cython and a C toolchain are available, the dependency-checker hot
+path is compiled ahead-of-time; otherwise the package runs unchanged as
+pure Python. The .py sources always remain the canonical fallback.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["portable/dependency_checker.py"], language_level=3
+    )
+except ImportError:
+    ext_modules = []
+
+setup(
+    name="portable-dependency-checker",
+    version="0.1.0",
+    packages=["portable"],
+    ext_modules=ext_modules,
+)